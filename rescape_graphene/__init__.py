@@ -13,6 +13,7 @@ from .graphql_helpers.json_field_helpers import (
     resolver_for_feature_collection,
     pick_selections,
     resolve_selections,
+    resolve_model_field_selections,
     model_resolver_for_dict_field,
     resolver_for_dict_field,
     resolver_for_dict_list
@@ -2,6 +2,7 @@ import ast
 from safedelete.models import SafeDeleteModel
 from collections import namedtuple
 
+from graphql.language import ast as graphql_ast
 from more_itertools import first
 from rescape_python_helpers import ramda as R
 from inflection import underscore
@@ -22,6 +23,25 @@ def resolve_selections(context):
     return R.map(lambda sel: sel.name.value, context.field_asts[0].selection_set.selections)
 
 
+def resolve_model_field_selections(context, model):
+    """
+        Returns the names of the model's concrete fields that are in the query, for use with QuerySet.only()
+        so that only the requested columns are selected
+    :param {ResolveInfo} context: The graphene resolution context
+    :param model: The Django model being queried
+    :return: {[String]} The underscored field names or None if the selections can't be resolved to fields,
+    such as when fragments are used. None means all fields should be loaded
+    """
+    selections = context.field_asts[0].selection_set.selections
+    if not R.all_satisfy(lambda sel: isinstance(sel, graphql_ast.Field), selections):
+        return None
+    model_field_names = set(R.map(lambda field: field.name, model._meta.concrete_fields))
+    return R.filter(
+        lambda field_name: field_name in model_field_names,
+        R.map(lambda sel: underscore(sel.name.value), selections)
+    )
+
+
 def pick_selections(selections, data):
     """
         Pick the selections from the current data
@@ -1,8 +1,10 @@
+import functools
 import inspect
 import json
 import logging
 import sys
-from decimal import Decimal
+from collections import defaultdict
+from decimal import Decimal as PythonDecimal
 
 import graphene
 import reversion
@@ -27,6 +29,9 @@ from .graphene_helpers import dump_graphql_keys, dump_graphql_data_object, camel
 logger = logging.getLogger('rescape_graphene')
 from django.conf import settings
 
+# camelize is regex based and is called with a small set of crud and class names, so cache it
+_camelize = functools.lru_cache(maxsize=256)(camelize)
+
 DENY = 'deny'
 # Indicates a CRUD operation is required to use this field
 REQUIRE = 'require'
@@ -155,14 +160,12 @@ class Decimal(Scalar):
 
     @staticmethod
     def serialize(dec):
-        assert isinstance(dec, Decimal), (
-            'Received not compatible Decimal "{}"'.format(repr(dec))
-        )
+        # Serializes python Decimals as well as numbers and strings
         return str(dec)
 
     @staticmethod
     def parse_value(value):
-        return Decimal(value)
+        return PythonDecimal(value)
 
     @classmethod
     def parse_literal(cls, node):
@@ -239,7 +242,7 @@ def input_type_class(field_config, crud, parent_type_classes, fields_only=False,
             graphene_class.__name__,
             # Use the ancestry for uniqueness of name
             R.join('of', R.concat([''], modified_parent_type_classes)),
-            camelize(crud, True)),
+            _camelize(crud, True)),
         (InputObjectType,),
         # RECURSION
         # Create Graphene types for the InputType based on the field_dict_value.fields
@@ -345,39 +348,34 @@ def related_input_field(field_dict_value, parent_type_classes, *args, **kwargs):
                                             **kwargs)
 
 
-@R.curry
-def related_input_field_for_crud_type(field_dict_value, parent_type_classes, crud):
+def related_input_field_for_crud_type(field_dict_value, parent_type_classes):
     """
         Resolved the foreign key input field for the given crud type
     :param field_dict_value: The corresponding field dict value. This must exist and have a graphene_type
     that matches the Django model and it must have a fields property that is a field_dict for that relation
-    :param crud: CREATE or UPDATE
     :param parent_type_classes: String or String array of parent graphene type classes. Unfortunately, Graphene doesn't
-    :return:
+    :return: A function expecting the crud type, CREATE or UPDATE, that returns a function expecting the
+    args and kwargs of the InputField
     """
-    return lambda *args, **kwargs: related_input_field(field_dict_value, parent_type_classes, *args, **kwargs)(crud)
 
+    def for_crud_type(crud):
+        def resolve_related_input_field(*args, **kwargs):
+            return related_input_field(field_dict_value, parent_type_classes, *args, **kwargs)(crud)
 
-def django_to_graphene_type(field, field_dict_value, parent_type_classes):
+        return resolve_related_input_field
+
+    return for_crud_type
+
+
+@functools.lru_cache(maxsize=None)
+def _django_to_graphene_types():
     """
-        Resolve the actual Graphene Field type. I can't find a good way to do this automatically.
-    :param field: The Django Field
-    :param field_dict_value: The corresponding field_dict value if it exists. This required for related fields.
-    For related fields it must contain field_dict_value.graphene_type, which is the graphene type for that field
-    as well as a fields property which is the fields_dict for that field
-    :param parent_type_classes: String array of parent graphene types for dynamic class naming. This is needed
-    because Graphene doesn't allow duplicate class names (even if they represent the same class type relationship
-    in different parts of the schema)
-    :return: The resolved or generated Graphene type
+        The static mapping of Django field classes to Graphene types, built once on first use.
+        This can't be a module-level constant because GrapheneFeatureCollection imports this module
+    :return: A dict keyed by Django field class and valued by Graphene type
     """
-    if R.prop_or(False, 'graphene_type', field_dict_value or {}):
-        # This is detected as a lambda and called first with crud to establish what fields are needed in the
-        # dynamic InputField subclass. Then another lambda is returned expecting args and kwargs, just like
-        # the other graphene types above
-        return related_input_field_for_crud_type(field_dict_value, parent_type_classes)
-
     from rescape_graphene.schema_models.geojson.types import GrapheneFeatureCollection
-    types = {
+    return {
         AutoField: graphene.Int,
         IntegerField: graphene.Int,
         BigAutoField: graphene.Int,
@@ -399,13 +397,34 @@ def django_to_graphene_type(field, field_dict_value, parent_type_classes):
         # If we do use a GeosGeometryCollection I'm not sure if this mapping works
         GeometryCollectionField: GrapheneFeatureCollection
     }
+
+
+def django_to_graphene_type(field, field_dict_value, parent_type_classes):
+    """
+        Resolve the actual Graphene Field type. I can't find a good way to do this automatically.
+    :param field: The Django Field
+    :param field_dict_value: The corresponding field_dict value if it exists. This required for related fields.
+    For related fields it must contain field_dict_value.graphene_type, which is the graphene type for that field
+    as well as a fields property which is the fields_dict for that field
+    :param parent_type_classes: String array of parent graphene types for dynamic class naming. This is needed
+    because Graphene doesn't allow duplicate class names (even if they represent the same class type relationship
+    in different parts of the schema)
+    :return: The resolved or generated Graphene type
+    """
+    if field_dict_value and field_dict_value.get('graphene_type'):
+        # This is detected as a lambda and called first with crud to establish what fields are needed in the
+        # dynamic InputField subclass. Then another lambda is returned expecting args and kwargs, just like
+        # the other graphene types above
+        return related_input_field_for_crud_type(field_dict_value, parent_type_classes)
+
+    types = _django_to_graphene_types()
     cls = field.__class__
-    match = R.prop_or(None, cls, types)
+    match = types.get(cls)
     # Find the type that matches. If not match we assume that the class only has one base class,
     # such as GeometryField subclasses
     while not match:
         cls = cls.__bases__[0]
-        match = R.prop_or(None, cls, types)
+        match = types.get(cls)
     return match
 
 
@@ -421,11 +440,11 @@ def process_field(field_to_unique_field_groups, field, field_dict_value, parent_
     :param parent_type_classes: String array of parent graphene types for dynamic class naming
     :return: A dict with the unique property and anything else we need
     """
-    unique = R.compact([
-        PRIMARY if R.prop_or(False, 'primary_key', field) else None,
-        UNIQUE if R.prop_or(False, 'unique', field) else None,
-        R.prop_or(None, R.has('attname', field), field_to_unique_field_groups)
-    ])
+    unique = tuple(flag for flag in (
+        PRIMARY if getattr(field, 'primary_key', False) else None,
+        UNIQUE if getattr(field, 'unique', False) else None,
+        field_to_unique_field_groups.get(field.name)
+    ) if flag)
     # Normally the field_dict_value will delegate the type to the underlying Django model
     # In cases where we need an explicit type, because the field represents something modeled outside django,
     # like json blobs, we specify the type property on field_dict_value.graphene_type, which takes precedence
@@ -433,11 +452,30 @@ def process_field(field_to_unique_field_groups, field, field_dict_value, parent_
         # Resolves to a lambda that expects a crud value and then returns a lambda that expects args
         type=django_to_graphene_type(field, field_dict_value, parent_type_classes),
         # This tells that the relation is based on a Django class
-        django_type=R.item_path_or(None, ['graphene_type', '_meta', 'model'], field_dict_value),
+        django_type=django_model_of_graphene_type(field_dict_value.get('graphene_type')) if field_dict_value else None,
         unique=unique
     )
 
 
+@memoize()
+def django_model_fields_and_unique_groups(model):
+    """
+        Gathers the model fields and maps each field attr to its "unique together" groups.
+        Django model metadata doesn't change at runtime, so this is memoized per model
+    :param model: The Django model
+    :return: A tuple of the model's fields (including many-to-many and related objects) and a dict
+    keyed by field name and valued by the "unique together" groups the field is in
+    """
+    # Map each attr to all "unique together" tuples it's in
+    field_to_unique_field_groups = defaultdict(list)
+    for uniq_field_group in model._meta.unique_together:
+        uniq_field_group_key = ','.join(uniq_field_group)
+        for attrname in uniq_field_group:
+            field_to_unique_field_groups[attrname].append(uniq_field_group_key)
+    fields = R.concat(model._meta.fields, R.concat(model._meta.many_to_many, model._meta.related_objects))
+    return fields, dict(field_to_unique_field_groups)
+
+
 def parse_django_class(model, field_dict, parent_type_classes=[]):
     """
         Parse the fields of a Django model to merge important properties with
@@ -449,19 +487,7 @@ def parse_django_class(model, field_dict, parent_type_classes=[]):
     :param parent_type_classes Single class or array of parent classes of this graphene class
     :return:
     """
-    # This mess just maps each attr to all "unique together" tuples it's in
-    field_to_unique_field_groups = R.from_pairs_to_array_values(
-        R.flatten(
-            R.map(
-                lambda uniq_field_group:
-                R.map(
-                    lambda attrname: [attrname, R.join(',', uniq_field_group)],
-                    uniq_field_group
-                ),
-                model._meta.unique_together
-            )
-        )
-    )
+    model_fields, field_to_unique_field_groups = django_model_fields_and_unique_groups(model)
     return R.from_pairs(R.map(
         lambda field: [
             # Key by file.name
@@ -477,7 +503,7 @@ def parse_django_class(model, field_dict, parent_type_classes=[]):
         # Only accept model fields that are defined in field_dict
         R.filter(
             lambda field: field.name in field_dict,
-            R.concat(model._meta.fields, R.concat(model._meta.many_to_many, model._meta.related_objects))
+            model_fields
         )
     ))
 
@@ -488,7 +514,7 @@ def django_model_of_graphene_type(graphene_type):
     :param graphene_type: Graphene ObjectType subclass
     :return: The Django model type or None
     """
-    return R.item_str_path_or(None, '_meta.model', graphene_type)
+    return getattr(getattr(graphene_type, '_meta', None), 'model', None)
 
 
 def merge_with_django_properties(graphene_type, field_dict):
@@ -500,12 +526,13 @@ def merge_with_django_properties(graphene_type, field_dict):
     :param field_dict:
     :return:
     """
-    return R.merge_deep(
-        field_dict,
-        R.pick(
-            R.keys(field_dict),
-            parse_django_class(django_model_of_graphene_type(graphene_type), field_dict, graphene_type))
-    )
+    django_properties = parse_django_class(django_model_of_graphene_type(graphene_type), field_dict, graphene_type)
+    # Each field config is a flat dict of properties, so a per-field merge suffices.
+    # The Django properties (type, django_type, unique) take precedence, as they always have
+    return {
+        key: {**value, **django_properties[key]} if key in django_properties else value
+        for key, value in field_dict.items()
+    }
 
 
 @R.curry
@@ -549,17 +576,12 @@ def allowed_read_fields(fields_dict, graphene_type):
     :param graphen_type: Type used for emboded input class naming
     :return: dict of field keys and there graphene type, either a primitive or input type
     """
-    return R.compose(
-        R.map_dict(resolve_type(graphene_type)),
-        R.filter_dict(
-            lambda key_value:
-            # Don't allow DENYed READ fields to be used for querying
-            R.and_func(
-                True,
-                R.not_func(R.prop_eq_or_in(READ, DENY, key_value[1]))
-            )
-        )
-    )(fields_dict)
+    return {
+        field_name: resolve_type(graphene_type, field_config)
+        for field_name, field_config in fields_dict.items()
+        # Don't allow DENYed READ fields to be used for querying
+        if field_config.get(READ) != DENY
+    }
 
 
 def allowed_filter_pairs(field_name, graphene_instance, field_config, fields_only=False):
@@ -661,25 +683,19 @@ def allowed_filter_arguments(fields_dict, graphene_type, fields_only=False):
     :param fields_only: Default false, Return fields only not types
     :return: dict of field keys and there graphene type, either a primitive or input type
     """
-    return R.compose(
-        lambda field_and_instance_and_config: add_filters(field_and_instance_and_config, fields_only=fields_only),
-        lambda dct: R.map_with_obj_to_values(
-            lambda field_name, field_config: dict(
+    return add_filters(
+        [
+            dict(
                 field_name=field_name,
                 field_config=field_config,
                 graphene_instance=resolve_type(graphene_type, field_config, fields_only=fields_only)
-            ),
-            dct
-        ),
-        lambda dct: R.filter_dict(
+            )
+            for field_name, field_config in call_if_lambda(fields_dict).items()
             # Don't allow DENYed READ fields to be used for querying
-            lambda key_value: R.and_func(
-                True,
-                R.not_func(R.prop_eq_or_in(READ, DENY, key_value[1]))
-            ),
-            dct
-        )
-    )(call_if_lambda(fields_dict))
+            if field_config.get(READ) != DENY
+        ],
+        fields_only=fields_only
+    )
 
 
 def guess_update_or_create(fields_dict):
@@ -714,17 +730,17 @@ def instantiate_graphene_type_or_fields(field_config, parent_type_classes, crud,
     """
 
     # Always favor the graphene_type that we specify in the field config. If it's not present use the django type
-    graphene_type = R.prop_or(R.prop_or(None, 'type', field_config), 'graphene_type', field_config)
+    graphene_type = field_config.get('graphene_type') or field_config.get('type')
 
     if not graphene_type:
         raise Exception("No graphene_type nor type parameter found on the field value."
                         " This usually means that a field was defined in the"
                         " field_dict that has no corresponding django field. To define a field with no corresponding"
                         " Django field, you must give the field a type parameter that is set to a GraphneType subclass")
-    graphene_type_modifier = R.prop_or(None, 'type_modifier', field_config)
+    graphene_type_modifier = field_config.get('type_modifier')
     if inspect.isclass(graphene_type) and issubclass(graphene_type, (ObjectType)):
         # ObjectTypes must be converted to a dynamic InputTypeVersion
-        fields = R.prop('fields', field_config)
+        fields = field_config['fields']
         resolved_graphene_type_or_fields = input_type_class(
             dict(graphene_type=graphene_type, fields=fields),
             crud,
@@ -733,17 +749,16 @@ def instantiate_graphene_type_or_fields(field_config, parent_type_classes, crud,
             with_filter_fields=True,
             create_filter_fields_for_search_type=create_filter_fields_for_search_type
         )
-    elif R.isfunction(graphene_type) and \
-            R.compose(R.equals(0), R.length, R.prop('parameters'), inspect.signature)(graphene_type):
+    elif inspect.isfunction(graphene_type) and not inspect.signature(graphene_type).parameters:
         # If out graphene_type is a no arg lambda it means it needs lazy evaluation to avoid circular imports
         # This is only true for representing reverse relationships on django models
         _graphene_type = graphene_type()
-        _fields = R.compose(call_if_lambda, R.prop('fields'))(field_config)
+        _fields = call_if_lambda(field_config['fields'])
         resolved_graphene_type_or_fields = input_type_class(
             dict(graphene_type=_graphene_type, fields=_fields), crud,
             parent_type_classes, fields_only=fields_only
         )
-    elif R.isfunction(graphene_type):
+    elif inspect.isfunction(graphene_type):
         # If a lambda is returned with params we have an InputType subclass that needs to know the crud type
         resolved_graphene_type_or_fields = graphene_type(crud)
 
@@ -762,7 +777,7 @@ def instantiate_graphene_type_or_fields(field_config, parent_type_classes, crud,
         resolved_graphene_type_or_fields(
             # Add required depending on whether this is an insert or update
             # This means if a user omits these fields an error will occur
-            required=R.prop_eq_or_in_or(False, crud, REQUIRE, field_config)
+            required=field_config.get(crud) == REQUIRE
         )
 
 
@@ -778,37 +793,31 @@ def input_type_fields(fields_dict, crud, parent_type_classes=[], fields_only=Fal
     """
     # Don't guess the crud type if create_filter_fields_for_search_type is true. We want it null in that case
     crud = crud or (guess_update_or_create(fields_dict) if not create_filter_fields_for_search_type else crud)
-    return R.map_with_obj(
-        lambda field_name, field_config: instantiate_graphene_type_or_fields(
+    return {
+        field_name: instantiate_graphene_type_or_fields(
             # field_name is just passed for debugging
             field_config, parent_type_classes, crud, field_name,
             fields_only=fields_only,
             create_filter_fields_for_search_type=create_filter_fields_for_search_type
-        ),
+        )
+        for field_name, field_config in call_if_lambda(fields_dict).items()
         # Filter out values that are deny
         # This means that if the user tries to pass these fields to graphql an error will occur
-        R.filter_dict(
-            lambda key_value: R.not_func(R.prop_eq_or(False, crud, DENY, key_value[1])),
-            call_if_lambda(fields_dict)
-        )
-    )
+        if field_config.get(crud) != DENY
+    }
 
 
-def key_value_based_on_unique_or_foreign(key_to_modified_key_and_value, fields_dict, key):
+def _is_unique_field(fields_dict, key):
     """
-        Returns either a simple dict(key=value) for keys that must have unique values (e.g. id, key, OneToOne rel)
-        Returns dict(default=dict(key=value)) for keys that need not have unique values
-    :param {String} key: The key to test
-    :return {dict}:
+        Returns true if the field at key is marked UNIQUE, meaning its value is used to check uniqueness
+        rather than going in update_or_create's defaults
+    :param fields_dict: The fields_dict for the Django model
+    :param key: The key to test
+    :return: True or False
     """
-    modified_key_value = key_to_modified_key_and_value[key]
-    # non-defaults are for checking uniqueness and then using for update/insert
-    # defaults are for updating/inserting
-    # this matches Django Query's update_or_create
-    # We don't bother with unique_together--it should be handled by the model's mutation handler
-    return modified_key_value if \
-        R.contains('unique', R.item_path_or([None], [key, 'unique'], fields_dict)) else \
-        dict(defaults=modified_key_value)
+    # This matches Django Query's update_or_create. We don't bother with unique_together groups,
+    # they should be handled by the model's mutation handler
+    return UNIQUE in (fields_dict[key].get('unique') or [])
 
 
 def input_type_parameters_for_update_or_create(fields_dict, field_name_to_value):
@@ -828,10 +837,10 @@ def input_type_parameters_for_update_or_create(fields_dict, field_name_to_value)
 
     # Convert foreign key dicts to their id, since Django expects the foreign key as an saved instance or id
     _related_object_id_if_django_type = related_object_id_if_django_type(fields_dict)
-    key_to_modified_key_and_value = R.map_with_obj(
-        _related_object_id_if_django_type,
-        R.omit(['id'], field_name_to_value)
-    )
+    key_to_modified_key_and_value = {
+        key: _related_object_id_if_django_type(key, value)
+        for key, value in field_name_to_value.items() if key != 'id'
+    }
     if R.has('id', field_name_to_value):
         # If we are doing an update with an id then the only value that doesn't go in defaults is id
         return dict(
@@ -846,18 +855,15 @@ def input_type_parameters_for_update_or_create(fields_dict, field_name_to_value)
         #   unique_key1=value, unique_key2=value, ...,
         #   defaults=(non_unique_key1=value, non_unique_key2=value, ...)
         # )
-        to_insert = R.merge_deep_all(R.map_with_obj_to_values(
-            lambda key, value: key_value_based_on_unique_or_foreign(
-                key_to_modified_key_and_value,
-                fields_dict,
-                key
-            ),
-            field_name_to_value
-        ))
+        unique_values, default_values = {}, {}
+        for key, modified_key_and_value in key_to_modified_key_and_value.items():
+            (unique_values if _is_unique_field(fields_dict, key) else default_values).update(modified_key_and_value)
         # If there are only defaults, which is true if no property must be globally unique, such as a key,
-        # then extract everything from defaults. This prevents a defaults only dict that makes Django
+        # then return the defaults directly. This prevents a defaults only dict that makes Django
         # return all model instances when it's testing to do an update or an insert
-        return R.when(R.compose(R.equals(1), R.length, R.keys), R.prop('defaults'))(to_insert)
+        if not unique_values:
+            return default_values
+        return R.merge(unique_values, dict(defaults=default_values)) if default_values else unique_values
 
 
 @R.curry
@@ -883,7 +889,45 @@ def related_object_id_if_django_type(fields_dict, key, value):
         raise e
 
 
-@R.curry
+@functools.lru_cache(maxsize=1024)
+def _build_query_string(query_name, variable_definitions, dumped_fields):
+    """
+        Forms the query string for graphql_query. The string is deterministic for the given arguments,
+        so it is cached rather than parsed and printed again on every call
+    :param query_name: The name of the query
+    :param variable_definitions: Tuple of (camelized variable name, graphql type name) pairs
+    :param dumped_fields: The fields to query, already dumped by dump_graphql_keys
+    :return: The query string
+    """
+    # Form the key values, camelizing the keys to match what graphql expects
+    formatted_definitions = R.join(
+        ', ',
+        R.map(
+            lambda key_value: f'${camelize(key_value[0], False)}: {key_value[1]}!',
+            variable_definitions
+        )
+    )
+    return print_ast(parse('''query %s%s { 
+            %s%s {
+                %s
+            }
+        }''' % (
+        query_name,
+        '(%s)' % formatted_definitions if formatted_definitions else '',
+        query_name,
+        '(%s)' %
+        R.join(
+            ', ',
+            # Put the variable definitions in (x: $x, y: $y, etc) if variable definitions exist
+            R.map(
+                lambda key_value: '%s: $%s' % (key_value[0], key_value[0]),
+                variable_definitions
+            )
+        ) if variable_definitions else '',
+        dumped_fields
+    )))
+
+
 def graphql_query(graphene_type, fields, query_name):
     """
         Creates a query based on the name and given fields
@@ -896,6 +940,8 @@ def graphql_query(graphene_type, fields, query_name):
     This results in query whatever(id: String!) { query_name(id: id) ... }
     """
     field_type_lookup = top_level_allowed_filter_arguments(fields, graphene_type)
+    # The fields to query are the same for every call unless field_overrides is given, so dump them once
+    dumped_fields = dump_graphql_keys(call_if_lambda(fields))
 
     def form_query(client, field_overrides={}, **kwargs):
         """
@@ -909,7 +955,7 @@ def graphql_query(graphene_type, fields, query_name):
         # read input type like 'FeatureCollectionDataTypeofFooTypeRelatedReadInputType'
         variable_definitions = R.map_key_values(
             lambda k, v: [
-                camelize(k, False),
+                _camelize(k, False),
                 R.if_else(
                     lambda lookup: R.has('_meta', lookup),
                     # Field Case
@@ -921,40 +967,17 @@ def graphql_query(graphene_type, fields, query_name):
             kwargs['variables']
         ) if R.has('variables', kwargs) else {}
 
-        # Form the key values, camelizing the keys to match what graphql expects
-        formatted_definitions = R.join(
-            ', ',
-            R.values(
-                R.map_with_obj(
-                    lambda key, value: f'${camelize(key, False)}: {value}!',
-                    variable_definitions
-                )
-            )
-        )
-        query = print_ast(parse('''query %s%s { 
-                %s%s {
-                    %s
-                }
-            }''' % (
-            query_name,
-            '(%s)' % formatted_definitions if formatted_definitions else '',
+        query = _build_query_string(
             query_name,
-            '(%s)' %
-            R.join(
-                ', ',
-                # Put the variable definitions in (x: $x, y: $y, etc) if variable definitions exist
-                R.map(
-                    lambda key: '%s: $%s' % (key, key),
-                    R.keys(variable_definitions))
-            ) if variable_definitions else '',
-            dump_graphql_keys(field_overrides or call_if_lambda(fields))
-        )))
+            tuple(variable_definitions.items()),
+            dump_graphql_keys(field_overrides) if field_overrides else dumped_fields
+        )
 
         # Update the variable names to have camel case instead of pythonic slugs
         camelized_kwargs = R.fake_lens_path_set(
             ['variables'],
             R.map_keys(
-                lambda key: camelize(key, False),
+                lambda key: _camelize(key, False),
                 R.prop_or({}, 'variables', kwargs)
             ),
             kwargs
@@ -977,8 +1000,42 @@ def capitalize_first_letter(str):
     return str[:1].upper() + str[1:]
 
 
-@R.curry
-def graphql_update_or_create(mutation_config, fields, client, values):
+# The mutation formed by graphql_update_or_create, e.g. for name='foo', crud_name='createFoo'
+# mutation fooMutation($data: CreateFooInputType!) { createFoo(fooData: $data) { foo { ...fields } } }
+_MUTATION_TEMPLATE = '''
+        mutation {name}Mutation($data: {input_type_name}InputType!) {{
+            {crud_name}({name}Data: $data) {{
+                {name} {{
+                    {fields}
+                }}
+            }}
+        }}'''
+
+@functools.lru_cache(maxsize=1024)
+def _build_mutation_string(name, crud_name, dumped_fields):
+    """
+        Forms the mutation string for graphql_update_or_create. Only the variables vary per call,
+        so the string is cached rather than parsed and printed again on every call
+    :param name: The camelized class name, e.g. 'foo'
+    :param crud_name: The schema function name, e.g. 'createFoo'
+    :param dumped_fields: The fields to return, already dumped by dump_graphql_keys
+    :return: The mutation string
+    """
+    return print_ast(parse(_MUTATION_TEMPLATE.format(
+        # The arbitrary(?) name for the mutation e.g. 'foo' makes 'fooMutation'. Consistant naming might be important
+        # for caching. It's also the parameter name prefix and the structure of the return query e.g. foo { ... }
+        name=name,
+        # The name of the InputDataType that is defined for this function, e.g. CreateFooInputType
+        input_type_name=capitalize_first_letter(crud_name),
+        # Actual schema function which matches something in the schema
+        # This will be createClass or updateClass where class is the class name e.g. createFoo or updateFoo
+        # Keep in mind that in python in the schema it will be defined create_foo or update_foo
+        crud_name=crud_name,
+        fields=dumped_fields
+    )))
+
+
+def graphql_update_or_create(mutation_config, fields):
     """
         Update or create by creating a graphql mutation
     :param mutation_config: A config in the form
@@ -992,47 +1049,41 @@ def graphql_update_or_create(mutation_config, fields, client, values):
         based on what is in values. For instance, it guesses that passing an id means the user wants to update
     :param fields: A dict of field names field definitions, such as that in user_schema. The keys can be
     Django/python style slugged or graphql camel case. They will be converted to graphql style
-    :param client: Graphene client
-    :param values: key values of what to update. keys can be slugs or camel case. They will be converted to camel
-    :return:
+    :returns A function that expects a Graphene client and values, key values of what to update.
+    keys can be slugs or camel case. They will be converted to camel
     """
-
-    # 'update' or 'create'. The default way of guessing is looking for presence of the 'id' property
-    # and guessing 'create' if id is missing
-    update_or_create = guess_update_or_create(values)
     # We name the mutation classNameMutation and the parameter classNameData
     # where className is the camel-case version of the given class name in mutation_config.class_name
-    name = camelize(R.prop('class_name', mutation_config), False)
-    mutation = print_ast(parse(''' 
-        mutation %sMutation($data: %sInputType!) {
-            %s(%sData: $data) {
-                %s {
-                    %s 
-                }
-            }
-        }''' % (
-        # The arbitrary(?) name for the mutation e.g. 'foo' makes 'fooMutation'. Consistant naming might be important
-        # for caching
-        name,
-        # Actual schema function which matches something in the schema
-        # This will be createClass or updateClass where class is the class name e.g. createFoo or updateFoo
-        # Keep in mind that in python in the schema it will be defined create_foo or update_foo
-        capitalize_first_letter(R.item_path(['crud', update_or_create], mutation_config)),
-        R.item_path(['crud', update_or_create], mutation_config),
-        # The name of the InputDataType that is defined for this function, e.g. FooInputDataType
-        name,
-        # Again the name, this time used for the structure of the return query e.g. foo { ...return value ...}
-        name,
-        # The return query dump, which are all the fields available that aren't marked read=IGNORE.
-        # One catch is we need to add the id,
-        # which isn't part of field_configs because Graphene handles ids automatically
-        dump_graphql_keys(R.merge(dict(id=dict(type=graphene.Int)), fields)),
-    )))
-    # Key values for what is being created or updated. This is dumped recursively and matches the structure
-    # of the InputDataType subclass
-    variables = dump_graphql_data_object(dict(data=values))
-    logger.debug(f'Mutation: {mutation}\nVariables: {variables}')
-    return client.execute(mutation, variables=camelize_graphql_data_object(dict(data=values)))
+    name = _camelize(R.prop('class_name', mutation_config), False)
+    # The return query dump, which are all the fields available that aren't marked read=IGNORE.
+    # One catch is we need to add the id,
+    # which isn't part of field_configs because Graphene handles ids automatically.
+    # These are the same for every call, so dump them once
+    dumped_fields = dump_graphql_keys(R.merge(dict(id=dict(type=graphene.Int)), fields))
+
+    def update_or_create(client, values):
+        """
+            Executes the create or update mutation
+        :param client: Graphene client
+        :param values: key values of what to update
+        :return: The result of the mutation
+        """
+        # 'update' or 'create'. The default way of guessing is looking for presence of the 'id' property
+        # and guessing 'create' if id is missing
+        crud = guess_update_or_create(values)
+        mutation = _build_mutation_string(
+            name,
+            R.item_path(['crud', crud], mutation_config),
+            dumped_fields
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Key values for what is being created or updated. This is dumped recursively and matches the structure
+            # of the InputDataType subclass. It's only needed for logging
+            variables = dump_graphql_data_object(dict(data=values))
+            logger.debug(f'Mutation: {mutation}\nVariables: {variables}')
+        return client.execute(mutation, variables=camelize_graphql_data_object(dict(data=values)))
+
+    return update_or_create
 
 
 def process_query_value(model, value_dict):
@@ -1364,8 +1415,11 @@ def query_with_filter_and_order_kwargs(model, **kwargs):
     :param kwargs:
     :return:
     """
-    q_expressions = process_filter_kwargs(model, **R.omit(['order_by'], kwargs))
-    query = model.objects.filter(*q_expressions)
+    filter_kwargs = R.omit(['order_by'], kwargs)
+    # Skip processing the filters entirely for the common query of all instances
+    query = model.objects.filter(*process_filter_kwargs(model, **filter_kwargs)) if \
+        filter_kwargs else \
+        model.objects.all()
     if not R.has('order_by', kwargs):
         return query
     else:
@@ -1420,9 +1474,28 @@ def query_sequentially(manager, manager_method, q_expressions_sets):
     )
 
 
+# Keyed by (id(fields), graphene_type) and valued by (fields, allowed filter arguments).
+# The value holds fields so that its id can't be reused while the entry exists
+_data_field_filter_arguments = {}
+
+
+def _allowed_filter_arguments_for_data_fields(fields, graphene_type):
+    """
+        Caches allowed_filter_arguments for the fields of json data field configs. The same module-level
+        fields dict, e.g. feature_data_type_fields, is used by many data types, so we only resolve it once
+    :param fields: The fields of the data field config
+    :param graphene_type: The graphene type of the data field config
+    :return: dict of field keys and there graphene type, either a primitive or input type
+    """
+    key = (id(fields), graphene_type)
+    if key not in _data_field_filter_arguments:
+        _data_field_filter_arguments[key] = (fields, allowed_filter_arguments(fields, graphene_type))
+    return _data_field_filter_arguments[key][1]
+
+
 def apply_type(v):
     # What filter arguments are allowed for this field type. Get them here
-    allowed_arguments = allowed_filter_arguments(R.prop('fields', v), R.prop('graphene_type', v)) if \
+    allowed_arguments = _allowed_filter_arguments_for_data_fields(R.prop('fields', v), R.prop('graphene_type', v)) if \
         R.has('fields', v) else None
 
     # If we have allowed arguments make args a 2 element array. The first element is always the graphene type to
@@ -1,12 +1,44 @@
-from inflection import underscore
+import functools
+
+from inflection import underscore, camelize
 from rescape_python_helpers import ramda as R
 from rescape_python_helpers.functional.ramda import pick_deep
 
 import re
 
-from rescape_graphene.graphql_helpers.schema_helpers import process_filter_kwargs
 from graphql import format_error
 
+# underscore and camelize are regex based and are called repeatedly with the same props and values keys, so cache them
+_underscore = functools.lru_cache(maxsize=256)(underscore)
+_camelize = functools.lru_cache(maxsize=256)(camelize)
+
+
+def _item_str_path(dct, path):
+    """
+        Resolves the dot-separated path in dct by direct indexing. Use R.item_str_path_or for paths that might be missing
+    :param dct: The dict, such as a graphql result
+    :param path: Dot-separated path, e.g. 'data.createRegion.region'
+    :return: The value at path
+    """
+    for key in path.split('.'):
+        dct = dct[key]
+    return dct
+
+
+def _pick_python_keys(graphql_obj, values):
+    """
+        Picks the keys of graphql_obj that correspond to the keys of values, plus id and key, and maps them back
+        to the python keys of values. The other keys of graphql_obj are never asserted on, so we don't convert them
+    :param graphql_obj: The camelized result object
+    :param values: The values used for the mutation
+    :return: The picked dict keyed by the python keys
+    """
+    wanted = {_camelize(key, False): key for key in values}
+    return {
+        wanted.get(key, key): value for key, value in graphql_obj.items()
+        if key in wanted or key in ('id', 'key')
+    }
+
 
 def quiz_model_query(client, model_query_function, result_name, variables, expect_length=1):
     """
@@ -27,7 +59,7 @@ def quiz_model_query(client, model_query_function, result_name, variables, expec
     # Check against errors
     assert not R.has('errors', result), R.dump_json(R.map(lambda e: format_error(e),R.prop('errors', result)))
     # Simple assertion that the query looks good
-    assert expect_length == R.length(R.item_path(['data', result_name], result))
+    assert expect_length == len(result['data'][result_name])
     return result
 
 
@@ -47,6 +79,8 @@ def quiz_model_paginated_query(client, model_class, paginated_query, result_name
     :param page_size: Default 1
     :return the first result (first page) and final result (last page) for further testing:
     """
+    from rescape_graphene.graphql_helpers.schema_helpers import process_filter_kwargs
+
     result = paginated_query(
         client,
         variables=dict(
@@ -60,26 +94,22 @@ def quiz_model_paginated_query(client, model_class, paginated_query, result_name
 
     # Check against errors
     assert not R.has('errors', result), R.dump_json(R.map(lambda e: format_error(e), R.prop('errors', result)))
-    first_page_objects = R.item_path(['data', result_name, 'objects'], result)
+    first_page_objects = result['data'][result_name]['objects']
     # Assert we got 1 result because our page is size 1
     assert page_size == R.compose(
         R.length,
         R.map(R.omit(omit_props)),
     )(first_page_objects)
 
+    # Let the database exclude the first page rather than instantiating every matching instance
+    first_page_ids = [int(obj['id']) for obj in first_page_objects]
     remaining_ids = list(
-        set(
-            R.map(
-                R.prop('id'),
-                model_class.objects.filter(
-                    *process_filter_kwargs(model_class, **R.map_keys(underscore, props))
-                ).order_by(*order_by.split(','))
-            )
-        ) -
-        set(R.map(R.compose(int, R.prop('id')), first_page_objects))
+        model_class.objects.filter(
+            *process_filter_kwargs(model_class, **R.map_keys(_underscore, props))
+        ).exclude(id__in=first_page_ids).values_list('id', flat=True)
     )
 
-    page_info = R.item_path(['data', result_name], result)
+    page_info = result['data'][result_name]
     # We have page_size pages so there should be a total number of pages
     # of what we specified for page_count_expected
     assert page_info['pages'] == page_count_expected
@@ -97,11 +127,11 @@ def quiz_model_paginated_query(client, model_class, paginated_query, result_name
     )
     # Make sure the new_result matches one of the remaining ids
     assert R.contains(
-        R.item_path(['data', result_name, 'objects', 0, 'id'], new_result),
+        new_result['data'][result_name]['objects'][0]['id'],
         remaining_ids
     )
 
-    new_page_info = R.item_path(['data', result_name], new_result)
+    new_page_info = new_result['data'][result_name]
     # Still expect the same page count
     assert new_page_info['pages'] == page_count_expected
     # Make sure it's the last page
@@ -156,20 +186,16 @@ def quiz_model_mutation_create(client, graphql_update_or_create_function, result
     """
     result = graphql_update_or_create_function(client, values=values)
 
-    result_path_partial = R.item_str_path(f'data.{result_path}')
     assert not R.has('errors', result), R.dump_json(R.map(lambda e: format_error(e), R.prop('errors', result)))
-    # Get the created value, using underscore to make the camelcase keys match python keys
-    created = R.map_keys(
-        lambda key: underscore(key),
-        result_path_partial(result)
-    )
+    # Get the created value, mapping the camelcase keys we need back to the python keys
+    created = _pick_python_keys(_item_str_path(result, f'data.{result_path}'), values)
     # get all the keys in values that are in created. This should match values if created has everything we expect
     assert values == pick_deep(created, values)
     # Try creating with the same values again, unique constraints will apply to force a create or an update will occur
     if second_create_results:
         new_result = graphql_update_or_create_function(client, values)
         assert not R.has('errors', new_result), R.dump_json(R.map(lambda e: format_error(e), R.prop('errors', new_result)))
-        created_too = result_path_partial(new_result)
+        created_too = _item_str_path(new_result, f'data.{result_path}')
         if second_create_does_update:
             assert created['id'] == created_too['id']
         if not second_create_does_update:
@@ -198,10 +224,7 @@ def quiz_model_mutation_update(client, graphql_update_or_create_function, create
     result = graphql_update_or_create_function(client, values=values)
     assert not R.has('errors', result), R.dump_json(R.map(lambda e: format_error(e), R.prop('errors', result)))
     # Extract the result and map the graphql keys to match the python keys
-    created = R.compose(
-        lambda r: R.map_keys(lambda key: underscore(key), r),
-        lambda r: R.item_str_path(f'data.{create_path}', r)
-    )(result)
+    created = _pick_python_keys(_item_str_path(result, f'data.{create_path}'), values)
     # look at the users added and omit the non-determinant dateJoined
     assert values == pick_deep(created, values)
     # Update with the id and optionally key if there is one + update_values
@@ -218,7 +241,7 @@ def quiz_model_mutation_update(client, graphql_update_or_create_function, create
         ])
     )
     assert not R.has('errors', update_result), R.dump_json(R.map(lambda e: format_error(e), R.prop('errors', update_result)))
-    updated = R.item_str_path(f'data.{update_path}', update_result)
+    updated = _item_str_path(update_result, f'data.{update_path}')
     assert created['id'] == updated['id']
     assert update_values == pick_deep(
         update_values,
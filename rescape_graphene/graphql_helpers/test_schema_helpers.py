@@ -1,4 +1,8 @@
-from rescape_graphene.graphql_helpers.schema_helpers import merge_data_fields_on_update
+from decimal import Decimal as PythonDecimal
+
+from rescape_graphene.graphql_helpers.schema_helpers import merge_data_fields_on_update, Decimal, \
+    _allowed_filter_arguments_for_data_fields
+from rescape_graphene.schema_models.geojson.types import feature_data_type_fields, FeatureDataType
 from snapshottest import TestCase, pytest
 
 
@@ -22,3 +26,14 @@ class TestGrapheneHelpers(TestCase):
             data=dict(jump=['jive'], then=dict(you='wail'), hold=dict(on=1, off=1)),
             also=1,
         )
+
+    def test_decimal_scalar(self):
+        assert Decimal.serialize(PythonDecimal('1.50')) == '1.50'
+        assert Decimal.parse_value('1.50') == PythonDecimal('1.50')
+        assert isinstance(Decimal.parse_value('1.50'), PythonDecimal)
+
+    def test_allowed_filter_arguments_for_data_fields(self):
+        filter_arguments = _allowed_filter_arguments_for_data_fields(feature_data_type_fields, FeatureDataType)
+        assert 'id' in filter_arguments
+        # The second call returns the cached result
+        assert _allowed_filter_arguments_for_data_fields(feature_data_type_fields, FeatureDataType) is filter_arguments
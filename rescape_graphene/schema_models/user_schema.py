@@ -9,6 +9,7 @@ from rescape_python_helpers import ramda as R
 
 from .django_object_type_revisioned_mixin import reversion_types, DjangoObjectTypeRevisionedMixin
 from ..django_helpers.write_helpers import increment_prop_until_unique
+from ..graphql_helpers.json_field_helpers import resolve_model_field_selections
 from ..graphql_helpers.schema_helpers import input_type_fields, REQUIRE, DENY, CREATE, \
     merge_with_django_properties, input_type_parameters_for_update_or_create, UPDATE, \
     guess_update_or_create, graphql_update_or_create, graphql_query, update_or_create_with_revision, \
@@ -36,15 +37,19 @@ user_fields = merge_with_django_properties(UserType, dict(
     **reversion_types
 ))
 
+# The filter arguments are the same for current_user and users
+user_filter_arguments = top_level_allowed_filter_arguments(user_fields, UserType)
+
+
 class UserQuery(ObjectType):
     current_user = graphene.Field(
         UserType,
-        **top_level_allowed_filter_arguments(user_fields, UserType)
+        **user_filter_arguments
     )
 
     users = graphene.List(
         UserType,
-        **top_level_allowed_filter_arguments(user_fields, UserType)
+        **user_filter_arguments
     )
 
     @staff_member_required
@@ -57,7 +62,11 @@ class UserQuery(ObjectType):
         :return:
         """
 
-        return query_with_filter_and_order_kwargs(get_user_model(), **kwargs)
+        user_model = get_user_model()
+        query = query_with_filter_and_order_kwargs(user_model, **kwargs)
+        # Only select the columns that were requested
+        field_names = resolve_model_field_selections(info, user_model)
+        return query.only(*field_names) if field_names else query
 
     def resolve_current_user(self, info):
         """
@@ -3,6 +3,8 @@ import logging
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rescape_python_helpers import ramda as R
 from reversion.models import Version
 from snapshottest import TestCase
@@ -64,6 +66,27 @@ class UserTypeCase(TestCase):
             dict(id=R.prop('id', self.user))
         )
 
+    def test_query_users_selects_requested_columns(self):
+        def user_selects(query):
+            with CaptureQueriesContext(connection) as context:
+                result = self.client.execute(query)
+            assert_no_errors(result)
+            return result, [q['sql'] for q in context.captured_queries if q['sql'].startswith('SELECT')]
+
+        result, selects = user_selects('query { users { id username } }')
+        # Only the requested columns are selected
+        assert selects and all('"auth_user"."password"' not in sql for sql in selects)
+        assert any('"auth_user"."username"' in sql for sql in selects)
+        # The results are unchanged
+        assert sorted(R.map(lambda user: [int(user['id']), user['username']], R.item_str_path('data.users', result))) == \
+               sorted(R.map(list, get_user_model().objects.values_list('id', 'username')))
+
+        # Fragments can't be resolved to fields, so all columns are loaded
+        _, fragment_selects = user_selects(
+            'query { users { ...userFields } } fragment userFields on UserType { id username }'
+        )
+        assert any('"auth_user"."password"' in sql for sql in fragment_selects)
+
     def test_query_current_user(self):
         result = user_schema.graphql_query_current_user(
             self.client,
@@ -1,4 +1,5 @@
 from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import Permission
 
 from rescape_graphene.schema_models.user_schema import UserType, user_fields
 
@@ -6,7 +7,7 @@ from sample_webapp.sample_schema import FooType, create_default_schema
 
 from sample_webapp.sample_schema import foo_fields
 from rescape_graphene.graphql_helpers.schema_helpers import allowed_read_fields, input_type_fields, CREATE, UPDATE, \
-    input_type_parameters_for_update_or_create, allowed_filter_arguments
+    input_type_parameters_for_update_or_create, allowed_filter_arguments, parse_django_class, UNIQUE
 from snapshottest import TestCase
 from rescape_python_helpers import ramda as R
 
@@ -38,6 +39,14 @@ class SchemaHelpersTypeCase(TestCase):
         self.assertMatchSnapshot(list(R.keys(input_type_fields(user_fields, UPDATE, UserType))))
         self.assertMatchSnapshot(list(R.keys(input_type_fields(foo_fields, UPDATE, FooType))))
 
+    def test_parse_django_class_unique_together(self):
+        # Permission has unique_together = [['content_type', 'codename']]
+        parsed = parse_django_class(Permission, dict(codename=dict(), name=dict()))
+        self.assertEqual(parsed['codename']['unique'], (['content_type,codename'],))
+        self.assertEqual(parsed['name']['unique'], ())
+        # Plain unique fields are still flagged
+        self.assertEqual(parse_django_class(FooType._meta.model, dict(key=dict()))['key']['unique'], (UNIQUE,))
+
     def test_update_fields_for_create_or_update(self):
         values = dict(email="dino@barn.farm", username="dino", first_name='T', last_name='Rex',
                       # Normally we'd use make_password here
@@ -51,6 +60,25 @@ class SchemaHelpersTypeCase(TestCase):
                       data =dict(example=2.2))
         self.assertMatchSnapshot(R.omit(['password'], input_type_parameters_for_update_or_create(foo_fields, foo_values)))
 
+        # Only unique keys are used directly for the uniqueness check, with no defaults
+        self.assertEqual(
+            input_type_parameters_for_update_or_create(user_fields, dict(username='dino')),
+            dict(username='dino')
+        )
+        # Unique keys plus defaults
+        self.assertEqual(
+            input_type_parameters_for_update_or_create(user_fields, dict(username='dino', first_name='T')),
+            dict(username='dino', defaults=dict(first_name='T'))
+        )
+
+
+    def test_update_fields_for_create_or_update_is_repeatable(self):
+        # The unique flags must survive repeated use, so username stays out of defaults on every call
+        values = dict(username='dino', first_name='T', last_name='Rex')
+        first = input_type_parameters_for_update_or_create(user_fields, values)
+        second = input_type_parameters_for_update_or_create(user_fields, values)
+        self.assertEqual(first, dict(username='dino', defaults=dict(first_name='T', last_name='Rex')))
+        self.assertEqual(second, first)
 
     # def test_delete(self):
     #    self.assertMatchSnapshot(delete_fields(user_fields))